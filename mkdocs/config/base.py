@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import functools
+import io
 import logging
 import os
 import sys
@@ -108,7 +109,11 @@ class ValidationError(Exception):
     """Raised during the validation process of the config on errors."""
 
     def __eq__(self, other):
-        return type(self) is type(other) and str(self) == str(other)
+        # Comparing `args` avoids formatting both messages in the common case.
+        return type(self) is type(other) and (self.args == other.args or str(self) == str(other))
+
+    def __hash__(self):
+        return hash((type(self), str(self)))
 
 
 PlainConfigSchemaItem = Tuple[str, BaseConfigOption]
@@ -176,6 +181,16 @@ class Config(UserDict):
         for key, config_option in self._schema:
             self[key] = config_option.default
 
+    def reset(self) -> None:
+        """
+        Discard all loaded user configs and restore the default value of every option.
+
+        This allows reusing the same instance (and schema) for several independent loads.
+        """
+        self.data.clear()
+        self.user_configs = []
+        self.set_defaults()
+
     def _validate(self) -> Tuple[ConfigErrors, ConfigWarnings]:
         failed: ConfigErrors = []
         warnings: ConfigWarnings = []
@@ -184,12 +199,13 @@ class Config(UserDict):
             try:
                 value = self.get(key)
                 self[key] = config_option.validate(value)
-                warnings.extend((key, w) for w in config_option.warnings)
+                if config_option.warnings:
+                    warnings.extend((key, w) for w in config_option.warnings)
                 config_option.reset_warnings()
             except ValidationError as e:
                 failed.append((key, e))
 
-        for key in set(self.keys()) - self._schema_keys:
+        for key in self.keys() - self._schema_keys:
             warnings.append((key, f"Unrecognised configuration name: {key}"))
 
         return failed, warnings
@@ -201,7 +217,8 @@ class Config(UserDict):
         for key, config_option in self._schema:
             try:
                 config_option.pre_validation(self, key_name=key)
-                warnings.extend((key, w) for w in config_option.warnings)
+                if config_option.warnings:
+                    warnings.extend((key, w) for w in config_option.warnings)
                 config_option.reset_warnings()
             except ValidationError as e:
                 failed.append((key, e))
@@ -215,7 +232,8 @@ class Config(UserDict):
         for key, config_option in self._schema:
             try:
                 config_option.post_validation(self, key_name=key)
-                warnings.extend((key, w) for w in config_option.warnings)
+                if config_option.warnings:
+                    warnings.extend((key, w) for w in config_option.warnings)
                 config_option.reset_warnings()
             except ValidationError as e:
                 failed.append((key, e))
@@ -243,17 +261,16 @@ class Config(UserDict):
         """Load config options from a dictionary."""
 
         if not isinstance(patch, dict):
-            raise exceptions.ConfigurationError(
-                "The configuration is invalid. The expected type was a key "
-                "value mapping (a python dict) but we got an object of type: "
-                f"{type(patch)}"
-            )
+            raise _not_a_mapping_error(type(patch))
 
         self.user_configs.append(patch)
         self.update(patch)
 
     def load_file(self, config_file: IO) -> None:
         """Load config options from the open file descriptor of a YAML file."""
+        if _is_yaml_sequence(config_file):
+            # Fail the same way `load_dict` would, without parsing the whole file first.
+            raise _not_a_mapping_error(list)
         try:
             return self.load_dict(utils.yaml_load(config_file))
         except YAMLError as e:
@@ -263,6 +280,40 @@ class Config(UserDict):
             )
 
 
+def _not_a_mapping_error(value_type: type) -> exceptions.ConfigurationError:
+    return exceptions.ConfigurationError(
+        "The configuration is invalid. The expected type was a key "
+        "value mapping (a python dict) but we got an object of type: "
+        f"{value_type}"
+    )
+
+
+def _is_yaml_sequence(config_file: IO) -> bool:
+    """
+    Return True if the first significant line of the YAML document starts a top-level block sequence.
+
+    Anything that can't be decided from that line alone (document markers, directives, flow
+    collections which may as well be mapping keys, ...) returns False and is left to the YAML
+    parser, as are streams which only support `read()`. The stream is returned to its original
+    position before returning.
+    """
+    seekable = getattr(config_file, 'seekable', None)
+    if not (seekable and seekable() and hasattr(config_file, 'readline')):
+        return False
+    pos = config_file.tell()
+    try:
+        for line in iter(config_file.readline, config_file.read(0)):
+            if isinstance(line, bytes):
+                line = line.decode('utf-8', errors='replace')
+            line = line.lstrip('\ufeff').strip()
+            if not line or line.startswith('#'):
+                continue
+            return line == '-' or line[:2] in ('- ', '-\t')
+        return False
+    finally:
+        config_file.seek(pos)
+
+
 @functools.lru_cache(maxsize=None)
 def get_schema(cls: type) -> PlainConfigSchema:
     """
@@ -283,6 +334,31 @@ class LegacyConfig(Config):
         super().__init__(config_file_path)
 
 
+_READ_SIZE = 1 << 20
+
+
+def _read_config_file(path: str) -> IO:
+    """
+    Read the file at `path` into memory and return it as a named binary stream.
+
+    Low-level `os.open`/`os.read` calls are used to avoid the extra syscalls of a buffered
+    file object. Reading continues until EOF, as pipes may return short reads before that.
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, 'O_CLOEXEC', 0) | getattr(os, 'O_BINARY', 0))
+    try:
+        chunks = []
+        while True:
+            chunk = os.read(fd, _READ_SIZE)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    stream = io.BytesIO(b''.join(chunks))
+    stream.name = path  # type: ignore
+    return stream
+
+
 @contextmanager
 def _open_config_file(config_file: Optional[Union[str, IO]]) -> Iterator[IO]:
     """
@@ -313,7 +389,7 @@ def _open_config_file(config_file: Optional[Union[str, IO]]) -> Iterator[IO]:
             path = os.path.abspath(path)
             log.debug(f"Loading configuration file: {path}")
             try:
-                result_config_file = open(path, 'rb')
+                result_config_file = _read_config_file(path)
                 break
             except FileNotFoundError:
                 continue
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import logging
 import os
 from typing import Optional, Sequence
@@ -35,11 +36,17 @@ class NoBabelExtension(InternationalizationExtension):  # pragma: no cover
 
 def parse_locale(locale) -> Locale:
     try:
-        return Locale.parse(locale, sep='_')
+        return _parse_locale(locale)
     except (ValueError, UnknownLocaleError, TypeError) as e:
         raise ValidationError(f'Invalid value for locale: {str(e)}')
 
 
+@functools.lru_cache(maxsize=64)
+def _parse_locale(locale) -> Locale:
+    # Locale instances are never modified, so the same one can be shared by all callers.
+    return Locale.parse(locale, sep='_')
+
+
 def install_translations(
     env: jinja2.Environment, locale: Locale, theme_dirs: Sequence[str]
 ) -> None:
@@ -1,4 +1,7 @@
+import io
 import os
+import threading
+import time
 import unittest
 
 from mkdocs import exceptions
@@ -40,6 +43,25 @@ class ConfigBaseTests(unittest.TestCase):
         )
         self.assertEqual(warnings, [])
 
+    def test_reset(self):
+        conf = base.Config(schema=(('option', c.Type(str, default='default')),))
+        conf.load_dict({'option': 'value', 'unknown': 1})
+        self.assertEqual(
+            conf.validate(), ([], [('unknown', 'Unrecognised configuration name: unknown')])
+        )
+
+        conf.reset()
+        self.assertEqual(conf.user_configs, [])
+        self.assertEqual(dict(conf), {'option': 'default'})
+        self.assertEqual(conf.validate(), ([], []))
+
+    def test_validation_error_equality(self):
+        self.assertEqual(ValidationError('foo'), ValidationError('foo'))
+        self.assertEqual(ValidationError(ValueError('foo')), ValidationError('foo'))
+        self.assertNotEqual(ValidationError('foo'), ValidationError('bar'))
+        self.assertNotEqual(ValidationError('foo'), exceptions.ConfigurationError('foo'))
+        self.assertEqual(hash(ValidationError('foo')), hash(ValidationError('foo')))
+
     @tempdir()
     def test_load_from_file(self, temp_dir):
         """
@@ -102,6 +124,64 @@ class ConfigBaseTests(unittest.TestCase):
         ):
             base.load_config(config_file='missing_file.yml')
 
+    @tempdir(files={'mkdocs.yml': '# comment\n\n- site_name: MkDocs Test\n'})
+    def test_load_sequence_file(self, temp_dir):
+        with self.assertRaisesRegex(
+            exceptions.ConfigurationError, "The expected type was a key value mapping"
+        ):
+            base.load_config(config_file=os.path.join(temp_dir, 'mkdocs.yml'))
+
+    @tempdir(files={'mkdocs.yml': '%YAML 1.1\n---\n-site_name: MkDocs Test\n'})
+    def test_load_file_not_a_sequence(self, temp_dir):
+        conf = base.Config(schema=())
+        with open(os.path.join(temp_dir, 'mkdocs.yml'), 'rb') as fd:
+            conf.load_file(fd)
+        self.assertEqual(dict(conf), {'-site_name': 'MkDocs Test'})
+
+    def test_load_file_flow_key(self):
+        conf = base.Config(schema=())
+        with self.assertRaisesRegex(exceptions.ConfigurationError, "unhashable key"):
+            conf.load_file(io.StringIO('[a]: b\n'))
+
+    def test_load_file_read_only_stream(self):
+        class Reader:
+            def __init__(self, data):
+                self._stream = io.StringIO(data)
+
+            def read(self, size=-1):
+                return self._stream.read(size)
+
+        conf = base.Config(schema=())
+        conf.load_file(Reader('foo: bar\n'))
+        self.assertEqual(dict(conf), {'foo': 'bar'})
+
+    def test_load_file_from_current_position(self):
+        config_file = io.StringIO('ignored: 1\nfoo: bar\n')
+        config_file.readline()
+        conf = base.Config(schema=())
+        conf.load_file(config_file)
+        self.assertEqual(dict(conf), {'foo': 'bar'})
+
+    @unittest.skipUnless(hasattr(os, 'mkfifo'), "requires named pipes")
+    @tempdir()
+    def test_load_from_pipe_with_short_reads(self, temp_dir):
+        path = os.path.join(temp_dir, 'mkdocs.yml')
+        os.mkfifo(path)
+
+        def write():
+            with open(path, 'wb', buffering=0) as fd:
+                fd.write(b'site_name: x\n')
+                time.sleep(0.1)
+                fd.write(b'nav: []\n')
+
+        writer = threading.Thread(target=write)
+        writer.start()
+        try:
+            stream = base._read_config_file(path)
+        finally:
+            writer.join()
+        self.assertEqual(stream.read(), b'site_name: x\nnav: []\n')
+
     @tempdir()
     def test_load_from_open_file(self, temp_path):
         """
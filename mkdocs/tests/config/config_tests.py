@@ -2,6 +2,7 @@
 
 import os
 import unittest
+from tempfile import TemporaryDirectory
 
 import mkdocs
 from mkdocs import config
@@ -12,8 +13,91 @@ from mkdocs.exceptions import ConfigurationError
 from mkdocs.localization import parse_locale
 from mkdocs.tests.base import dedent, tempdir
 
+_INVALID_YAML = dedent(
+    """
+    - ['index.md', 'Introduction']
+    - ['index.md', 'Introduction']
+    - ['index.md', 'Introduction']
+    """
+)
+_CONFIG_OPTION_YAML = dedent(
+    """
+    site_name: Example
+    nav:
+    - 'Introduction': 'index.md'
+    """
+)
+
+_MKDOCS_DIR = os.path.abspath(os.path.dirname(mkdocs.__file__))
+_TEMPLATES_DIR = os.path.join(_MKDOCS_DIR, 'templates')
+_THEME_DIR = os.path.join(_MKDOCS_DIR, 'themes')
+_MKDOCS_THEME = os.path.join(_THEME_DIR, 'mkdocs')
+_RTD_THEME = os.path.join(_THEME_DIR, 'readthedocs')
+
+_PARSED_EN = parse_locale('en')
+_PARSED_FR = parse_locale('fr')
+
+_MKDOCS_VARS = {
+    'name': 'mkdocs',
+    'locale': _PARSED_EN,
+    'include_search_page': False,
+    'search_index_only': False,
+    'analytics': {'gtag': None},
+    'highlightjs': True,
+    'hljs_style': 'github',
+    'hljs_languages': [],
+    'navigation_depth': 2,
+    'nav_style': 'primary',
+    'shortcuts': {'help': 191, 'next': 78, 'previous': 80, 'search': 83},
+}
+_READTHEDOCS_VARS = {
+    'name': 'readthedocs',
+    'locale': _PARSED_EN,
+    'include_search_page': True,
+    'search_index_only': False,
+    'analytics': {'anonymize_ip': False, 'gtag': None},
+    'highlightjs': True,
+    'hljs_languages': [],
+    'include_homepage_in_sidebar': True,
+    'prev_next_buttons_location': 'bottom',
+    'navigation_depth': 4,
+    'sticky_navigation': True,
+    'logo': None,
+    'titles_only': False,
+    'collapse_navigation': True,
+}
+
+# Cases of `test_doc_dir_in_site_dir`, each of which is expected to give exactly one error.
+_DOCDIR_CASES = (
+    {'docs_dir': os.path.join('site', 'docs'), 'site_dir': 'site'},
+    {'docs_dir': 'docs', 'site_dir': '.'},
+    {'docs_dir': '.', 'site_dir': '.'},
+    {'docs_dir': 'docs', 'site_dir': ''},
+    {'docs_dir': '', 'site_dir': ''},
+    {'docs_dir': 'docs', 'site_dir': 'docs'},
+)
+# Same as the default schema, but don't verify the docs_dir exists.
+_DOCDIR_SCHEMA = (
+    ('docs_dir', c.Dir(default='docs')),
+    ('site_dir', c.SiteDir(default='site')),
+    ('config_file_path', c.Type(str)),
+)
+
 
 class ConfigTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Custom theme dirs only need to exist, so they are shared by all tests of the class.
+        cls._theme_tempdir = TemporaryDirectory(prefix='mkdocs_test-')
+        cls.mytheme = os.path.join(cls._theme_tempdir.name, 'mytheme')
+        cls.custom = os.path.join(cls._theme_tempdir.name, 'custom')
+        os.makedirs(cls.mytheme, exist_ok=True)
+        os.makedirs(cls.custom, exist_ok=True)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._theme_tempdir.cleanup()
+
     def test_missing_config_file(self):
         with self.assertRaises(ConfigurationError):
             config.load_config(config_file='bad_filename.yaml')
@@ -33,16 +117,9 @@ class ConfigTests(unittest.TestCase):
 
     @tempdir()
     def test_invalid_config(self, temp_path):
-        file_contents = dedent(
-            """
-            - ['index.md', 'Introduction']
-            - ['index.md', 'Introduction']
-            - ['index.md', 'Introduction']
-            """
-        )
         config_path = os.path.join(temp_path, 'foo.yml')
         with open(config_path, 'w') as config_file:
-            config_file.write(file_contents)
+            config_file.write(_INVALID_YAML)
 
         with self.assertRaises(ConfigurationError):
             config.load_config(config_file=open(config_file.name, 'rb'))
@@ -57,161 +134,93 @@ class ConfigTests(unittest.TestCase):
             'site_name': 'Example',
             'nav': [{'Introduction': 'index.md'}],
         }
-        file_contents = dedent(
-            """
-            site_name: Example
-            nav:
-            - 'Introduction': 'index.md'
-            """
-        )
         config_path = os.path.join(temp_path, 'mkdocs.yml')
         with open(config_path, 'w') as config_file:
-            config_file.write(file_contents)
+            config_file.write(_CONFIG_OPTION_YAML)
         os.mkdir(os.path.join(temp_path, 'docs'))
 
         result = config.load_config(config_file=config_file.name)
         self.assertEqual(result['site_name'], expected_result['site_name'])
         self.assertEqual(result['nav'], expected_result['nav'])
 
-    @tempdir()
-    @tempdir()
-    def test_theme(self, mytheme, custom):
-        configs = [
-            dict(),  # default theme
-            {"theme": "readthedocs"},  # builtin theme
-            {"theme": {'name': 'readthedocs'}},  # builtin as complex
-            {"theme": {'name': None, 'custom_dir': mytheme}},  # custom only as complex
-            {
-                "theme": {'name': 'readthedocs', 'custom_dir': custom}
-            },  # builtin and custom as complex
-            {  # user defined variables
-                'theme': {
-                    'name': 'mkdocs',
-                    'locale': 'fr',
-                    'static_templates': ['foo.html'],
-                    'show_sidebar': False,
-                    'some_var': 'bar',
-                }
-            },
-        ]
-
-        mkdocs_dir = os.path.abspath(os.path.dirname(mkdocs.__file__))
-        mkdocs_templates_dir = os.path.join(mkdocs_dir, 'templates')
-        theme_dir = os.path.abspath(os.path.join(mkdocs_dir, 'themes'))
-
-        results = (
-            {
-                'dirs': [os.path.join(theme_dir, 'mkdocs'), mkdocs_templates_dir],
-                'static_templates': ['404.html', 'sitemap.xml'],
-                'vars': {
-                    'name': 'mkdocs',
-                    'locale': parse_locale('en'),
-                    'include_search_page': False,
-                    'search_index_only': False,
-                    'analytics': {'gtag': None},
-                    'highlightjs': True,
-                    'hljs_style': 'github',
-                    'hljs_languages': [],
-                    'navigation_depth': 2,
-                    'nav_style': 'primary',
-                    'shortcuts': {'help': 191, 'next': 78, 'previous': 80, 'search': 83},
+    def test_theme(self):
+        mytheme, custom = self.mytheme, self.custom
+        cases = [
+            (
+                dict(),  # default theme
+                {
+                    'dirs': [_MKDOCS_THEME, _TEMPLATES_DIR],
+                    'static_templates': ['404.html', 'sitemap.xml'],
+                    'vars': _MKDOCS_VARS,
                 },
-            },
-            {
-                'dirs': [os.path.join(theme_dir, 'readthedocs'), mkdocs_templates_dir],
-                'static_templates': ['404.html', 'sitemap.xml'],
-                'vars': {
-                    'name': 'readthedocs',
-                    'locale': parse_locale('en'),
-                    'include_search_page': True,
-                    'search_index_only': False,
-                    'analytics': {'anonymize_ip': False, 'gtag': None},
-                    'highlightjs': True,
-                    'hljs_languages': [],
-                    'include_homepage_in_sidebar': True,
-                    'prev_next_buttons_location': 'bottom',
-                    'navigation_depth': 4,
-                    'sticky_navigation': True,
-                    'logo': None,
-                    'titles_only': False,
-                    'collapse_navigation': True,
+            ),
+            (
+                {"theme": "readthedocs"},  # builtin theme
+                {
+                    'dirs': [_RTD_THEME, _TEMPLATES_DIR],
+                    'static_templates': ['404.html', 'sitemap.xml'],
+                    'vars': _READTHEDOCS_VARS,
                 },
-            },
-            {
-                'dirs': [os.path.join(theme_dir, 'readthedocs'), mkdocs_templates_dir],
-                'static_templates': ['404.html', 'sitemap.xml'],
-                'vars': {
-                    'name': 'readthedocs',
-                    'locale': parse_locale('en'),
-                    'include_search_page': True,
-                    'search_index_only': False,
-                    'analytics': {'anonymize_ip': False, 'gtag': None},
-                    'highlightjs': True,
-                    'hljs_languages': [],
-                    'include_homepage_in_sidebar': True,
-                    'prev_next_buttons_location': 'bottom',
-                    'navigation_depth': 4,
-                    'sticky_navigation': True,
-                    'logo': None,
-                    'titles_only': False,
-                    'collapse_navigation': True,
+            ),
+            (
+                {"theme": {'name': 'readthedocs'}},  # builtin as complex
+                {
+                    'dirs': [_RTD_THEME, _TEMPLATES_DIR],
+                    'static_templates': ['404.html', 'sitemap.xml'],
+                    'vars': _READTHEDOCS_VARS,
                 },
-            },
-            {
-                'dirs': [mytheme, mkdocs_templates_dir],
-                'static_templates': ['sitemap.xml'],
-                'vars': {'name': None, 'locale': parse_locale('en')},
-            },
-            {
-                'dirs': [custom, os.path.join(theme_dir, 'readthedocs'), mkdocs_templates_dir],
-                'static_templates': ['404.html', 'sitemap.xml'],
-                'vars': {
-                    'name': 'readthedocs',
-                    'locale': parse_locale('en'),
-                    'include_search_page': True,
-                    'search_index_only': False,
-                    'analytics': {'anonymize_ip': False, 'gtag': None},
-                    'highlightjs': True,
-                    'hljs_languages': [],
-                    'include_homepage_in_sidebar': True,
-                    'prev_next_buttons_location': 'bottom',
-                    'navigation_depth': 4,
-                    'sticky_navigation': True,
-                    'logo': None,
-                    'titles_only': False,
-                    'collapse_navigation': True,
+            ),
+            (
+                {"theme": {'name': None, 'custom_dir': mytheme}},  # custom only as complex
+                {
+                    'dirs': [mytheme, _TEMPLATES_DIR],
+                    'static_templates': ['sitemap.xml'],
+                    'vars': {'name': None, 'locale': _PARSED_EN},
                 },
-            },
-            {
-                'dirs': [os.path.join(theme_dir, 'mkdocs'), mkdocs_templates_dir],
-                'static_templates': ['404.html', 'sitemap.xml', 'foo.html'],
-                'vars': {
-                    'name': 'mkdocs',
-                    'locale': parse_locale('fr'),
-                    'show_sidebar': False,
-                    'some_var': 'bar',
-                    'include_search_page': False,
-                    'search_index_only': False,
-                    'analytics': {'gtag': None},
-                    'highlightjs': True,
-                    'hljs_style': 'github',
-                    'hljs_languages': [],
-                    'navigation_depth': 2,
-                    'nav_style': 'primary',
-                    'shortcuts': {'help': 191, 'next': 78, 'previous': 80, 'search': 83},
+            ),
+            (
+                {"theme": {'name': 'readthedocs', 'custom_dir': custom}},  # builtin and custom
+                {
+                    'dirs': [custom, _RTD_THEME, _TEMPLATES_DIR],
+                    'static_templates': ['404.html', 'sitemap.xml'],
+                    'vars': _READTHEDOCS_VARS,
                 },
-            },
-        )
+            ),
+            (
+                {  # user defined variables
+                    'theme': {
+                        'name': 'mkdocs',
+                        'locale': 'fr',
+                        'static_templates': ['foo.html'],
+                        'show_sidebar': False,
+                        'some_var': 'bar',
+                    }
+                },
+                {
+                    'dirs': [_MKDOCS_THEME, _TEMPLATES_DIR],
+                    'static_templates': ['404.html', 'sitemap.xml', 'foo.html'],
+                    'vars': {
+                        **_MKDOCS_VARS,
+                        'locale': _PARSED_FR,
+                        'show_sidebar': False,
+                        'some_var': 'bar',
+                    },
+                },
+            ),
+        ]
 
-        for config_contents, result in zip(configs, results):
+        conf = config.Config(schema=(('theme', c.Theme(default='mkdocs')),))
+        for config_contents, result in cases:
             with self.subTest(config_contents):
-                conf = config.Config(schema=(('theme', c.Theme(default='mkdocs')),))
+                conf.reset()
                 conf.load_dict(config_contents)
                 errors, warnings = conf.validate()
                 self.assertEqual(errors, [])
                 self.assertEqual(warnings, [])
                 self.assertEqual(conf['theme'].dirs, result['dirs'])
-                self.assertEqual(conf['theme'].static_templates, set(result['static_templates']))
+                self.assertEqual(
+                    conf['theme'].static_templates, frozenset(result['static_templates'])
+                )
                 self.assertEqual({k: conf['theme'][k] for k in iter(conf['theme'])}, result['vars'])
 
     def test_empty_nav(self):
@@ -239,33 +248,16 @@ class ConfigTests(unittest.TestCase):
         self.assertEqual(warnings, [])
 
     def test_doc_dir_in_site_dir(self):
-        j = os.path.join
-
-        test_configs = (
-            {'docs_dir': j('site', 'docs'), 'site_dir': 'site'},
-            {'docs_dir': 'docs', 'site_dir': '.'},
-            {'docs_dir': '.', 'site_dir': '.'},
-            {'docs_dir': 'docs', 'site_dir': ''},
-            {'docs_dir': '', 'site_dir': ''},
-            {'docs_dir': 'docs', 'site_dir': 'docs'},
-        )
-
         cfg = {
-            'config_file_path': j(os.path.abspath('..'), 'mkdocs.yml'),
+            'config_file_path': os.path.join(os.path.abspath('..'), 'mkdocs.yml'),
         }
+        conf = config.Config(schema=_DOCDIR_SCHEMA)
 
-        for test_config in test_configs:
+        for test_config in _DOCDIR_CASES:
             with self.subTest(test_config):
                 patch = {**cfg, **test_config}
 
-                # Same as the default schema, but don't verify the docs_dir exists.
-                conf = config.Config(
-                    schema=(
-                        ('docs_dir', c.Dir(default='docs')),
-                        ('site_dir', c.SiteDir(default='site')),
-                        ('config_file_path', c.Type(str)),
-                    )
-                )
+                conf.reset()
                 conf.load_dict(patch)
 
                 errors, warnings = conf.validate()
@@ -27,6 +27,12 @@ class LocalizationTests(unittest.TestCase):
         self.assertEqual(locale.territory, 'US')
         self.assertEqual(str(locale), 'en_US')
 
+    def test_locale_is_cached(self):
+        self.assertIs(parse_locale('en'), parse_locale('en'))
+
+    def test_unhashable_locale(self):
+        self.assertRaises(ValidationError, parse_locale, ['en'])
+
     def test_unknown_locale(self):
         self.assertRaises(ValidationError, parse_locale, 'foo')
 
@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 
 import datetime
+import io
 import logging
 import os
 import posixpath
@@ -8,6 +9,8 @@ import stat
 import unittest
 from unittest import mock
 
+import yaml
+
 from mkdocs import exceptions, utils
 from mkdocs.structure.files import File
 from mkdocs.structure.pages import Page
@@ -430,6 +433,55 @@ class UtilsTests(unittest.TestCase):
         self.assertTrue(isinstance(config['key'], str))
         self.assertTrue(isinstance(config['key2'][0], str))
 
+    def test_yaml_load_cached_copy(self):
+        yaml_src = dedent(
+            '''
+            key: value
+            nested:
+              - item
+            '''
+        )
+
+        first = utils.yaml_load(yaml_src)
+        first['nested'].append('other')
+        second = utils.yaml_load(yaml_src)
+        self.assertEqual(second, {'key': 'value', 'nested': ['item']})
+        self.assertIsNot(first['nested'], second['nested'])
+
+    def test_yaml_load_python_objects(self):
+        yaml_src = 'm: !!python/module:os'
+        self.assertIs(utils.yaml_load(yaml_src)['m'], os)
+        self.assertIs(utils.yaml_load(yaml_src)['m'], os)
+
+    def test_get_yaml_loader_is_independent(self):
+        Loader = utils.get_yaml_loader()
+        self.assertIsNot(Loader, utils.get_yaml_loader())
+        Loader.add_constructor('!foo', lambda loader, node: 'FOO')
+        self.assertEqual(utils.yaml_load('a: !foo x', Loader), {'a': 'FOO'})
+        with self.assertRaises(yaml.constructor.ConstructorError):
+            utils.yaml_load('a: !foo x')
+
+    def test_env_var_in_yaml_not_cached(self):
+        yaml_src = 'key: !ENV VARNAME'
+        with mock.patch.dict(os.environ, {'VARNAME': 'first'}):
+            self.assertEqual(utils.yaml_load(yaml_src), {'key': 'first'})
+        with mock.patch.dict(os.environ, {'VARNAME': 'second'}):
+            self.assertEqual(utils.yaml_load(yaml_src), {'key': 'second'})
+
+    def test_env_var_in_utf16_yaml_not_cached(self):
+        yaml_src = 'key: !ENV VARNAME'.encode('utf-16')
+        with mock.patch.dict(os.environ, {'VARNAME': 'first'}):
+            self.assertEqual(utils.yaml_load(io.BytesIO(yaml_src)), {'key': 'first'})
+        with mock.patch.dict(os.environ, {'VARNAME': 'second'}):
+            self.assertEqual(utils.yaml_load(io.BytesIO(yaml_src)), {'key': 'second'})
+
+    def test_env_var_tag_shorthand_not_cached(self):
+        yaml_src = '%TAG !e! !EN\n---\nkey: !e!V VARNAME\n'
+        with mock.patch.dict(os.environ, {'VARNAME': 'first'}):
+            self.assertEqual(utils.yaml_load(yaml_src), {'key': 'first'})
+        with mock.patch.dict(os.environ, {'VARNAME': 'second'}):
+            self.assertEqual(utils.yaml_load(yaml_src), {'key': 'second'})
+
     @mock.patch.dict(os.environ, {'VARNAME': 'Hello, World!', 'BOOLVAR': 'false'})
     def test_env_var_in_yaml(self):
         yaml_src = dedent(
@@ -29,14 +29,17 @@ class Theme:
 
     """
 
+    _MKDOCS_TEMPLATES = os.path.join(os.path.abspath(os.path.dirname(__file__)), 'templates')
+    # Templates shipped with MkDocs itself, listed once rather than for every theme instance.
+    _DEFAULT_STATIC_TEMPLATES = frozenset(os.listdir(_MKDOCS_TEMPLATES))
+
     def __init__(self, name: Optional[str] = None, **user_config) -> None:
         self.name = name
         self._vars = {'name': name, 'locale': 'en'}
 
         # MkDocs provided static templates are always included
-        package_dir = os.path.abspath(os.path.dirname(__file__))
-        mkdocs_templates = os.path.join(package_dir, 'templates')
-        self.static_templates = set(os.listdir(mkdocs_templates))
+        mkdocs_templates = self._MKDOCS_TEMPLATES
+        self.static_templates = set(self._DEFAULT_STATIC_TEMPLATES)
 
         # Build self.dirs from various sources in order of precedence
         self.dirs = []
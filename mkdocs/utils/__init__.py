@@ -6,7 +6,10 @@ and structure of the site and pages in the site.
 """
 from __future__ import annotations
 
+import copy
 import functools
+import hashlib
+import io
 import logging
 import os
 import posixpath
@@ -15,7 +18,7 @@ import shutil
 import sys
 import warnings
 from collections import defaultdict
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 from pathlib import PurePath
 from typing import (
     IO,
@@ -43,6 +46,12 @@ import yaml
 from mergedeep import merge
 from yaml_env_tag import construct_env_tag
 
+try:
+    from yaml import CLoader as _BaseLoader
+except ImportError:  # pragma: no cover
+    # PyYAML was built without libyaml, fall back to the pure-Python loader.
+    from yaml import Loader as _BaseLoader  # type: ignore
+
 from mkdocs import exceptions
 
 if TYPE_CHECKING:
@@ -61,8 +70,12 @@ markdown_extensions = (
 )
 
 
-def get_yaml_loader(loader=yaml.Loader):
-    """Wrap PyYaml's loader so we can extend it to suit our needs."""
+def get_yaml_loader(loader=_BaseLoader):
+    """
+    Wrap PyYaml's loader so we can extend it to suit our needs.
+
+    The libyaml-based `CLoader` is used by default when available.
+    """
 
     class Loader(loader):
         """
@@ -77,10 +90,82 @@ def get_yaml_loader(loader=yaml.Loader):
     return Loader
 
 
+def _construct_env_tag_uncached(loader, node):
+    """Like `construct_env_tag`, but mark the document as depending on the environment."""
+    loader.depends_on_env = True
+    return construct_env_tag(loader, node)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_default_yaml_loader() -> Type[yaml.Loader]:
+    """The loader used by `yaml_load` when none is given. Private, so it is never extended."""
+    Loader = get_yaml_loader()
+    Loader.add_constructor('!ENV', _construct_env_tag_uncached)
+    return Loader
+
+
+_YAML_CACHE_SIZE = 256
+_yaml_cache: Dict[bytes, Any] = {}
+
+
+def _yaml_parse(source: Union[IO, str], Loader: Type[yaml.Loader]) -> Any:
+    """
+    Parse YAML from `source`, reusing the result of a previous parse of identical content.
+
+    Caching only happens with the default loader; other loaders may gain constructors at any time.
+
+    Only plain data (mappings, sequences and scalars) is cached, as other objects built by the
+    loader may not be copyable. Documents which use the `!ENV` tag are never cached, as their
+    result depends on the environment.
+    A deep copy of the cached result is returned, so callers are free to modify it.
+    """
+    data = source.read() if hasattr(source, 'read') else source
+    if Loader is not _get_default_yaml_loader():
+        return yaml.load(_named_stream(data, source), Loader=Loader)
+
+    raw = data.encode('utf-8') if isinstance(data, str) else data
+    key = hashlib.blake2b(raw, digest_size=16).digest()
+    try:
+        result = _yaml_cache[key]
+    except KeyError:
+        loader = Loader(_named_stream(data, source))
+        try:
+            result = loader.get_single_data()
+        finally:
+            loader.dispose()
+        if getattr(loader, 'depends_on_env', False) or not _is_plain_data(result):
+            return result
+        if len(_yaml_cache) >= _YAML_CACHE_SIZE:
+            del _yaml_cache[next(iter(_yaml_cache))]
+        _yaml_cache[key] = result
+    return copy.deepcopy(result)
+
+
+_PLAIN_SCALARS = (str, bytes, int, float, bool, type(None), datetime, date)
+
+
+def _is_plain_data(obj: Any) -> bool:
+    """Return True if `obj` only consists of dicts, lists and plain scalars."""
+    if isinstance(obj, dict):
+        return all(_is_plain_data(k) and _is_plain_data(v) for k, v in obj.items())
+    if isinstance(obj, list):
+        return all(_is_plain_data(item) for item in obj)
+    return type(obj) in _PLAIN_SCALARS
+
+
+def _named_stream(data: Union[str, bytes], source: Union[IO, str]) -> Union[IO, str]:
+    """Wrap already read `data` into a stream carrying the name of `source` for error messages."""
+    if not hasattr(source, 'read'):
+        return data
+    stream: IO = io.StringIO(data) if isinstance(data, str) else io.BytesIO(data)
+    stream.name = getattr(source, 'name', '<file>')  # type: ignore
+    return stream
+
+
 def yaml_load(source: Union[IO, str], loader: Optional[Type[yaml.Loader]] = None) -> Dict[str, Any]:
     """Return dict of source YAML file using loader, recursively deep merging inherited parent."""
-    Loader = loader or get_yaml_loader()
-    result = yaml.load(source, Loader=Loader)
+    Loader = loader or _get_default_yaml_loader()
+    result = _yaml_parse(source, Loader)
     if result is None:
         return {}
     if 'INHERIT' in result and not isinstance(source, str):